@@ -1,20 +1,24 @@
-from .config import (
-    AppConfig,
-    config,
-)
-from .console_printer import ConsolePrinter
-from .data_analyzer import DataAnalyzer
-from .google_sheets_client import (
-    CSVReader,
-    GoogleSheetsClient,
-    GoogleSheetsError,
-)
-from .llm_processor import LLMProcessor
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config import (
+        AppConfig,
+        get_settings,
+    )
+    from .console_printer import ConsolePrinter
+    from .data_analyzer import DataAnalyzer
+    from .google_sheets_client import (
+        CSVReader,
+        GoogleSheetsClient,
+        GoogleSheetsError,
+    )
+    from .llm_processor import LLMProcessor
 
 
 __all__ = [
     "AppConfig",
-    "config",
+    "get_settings",
     "ConsolePrinter",
     "DataAnalyzer",
     "CSVReader",
@@ -22,3 +26,26 @@ __all__ = [
     "GoogleSheetsError",
     "LLMProcessor",
 ]
+
+# Submodules are imported on first attribute access, so a CSV run
+# does not pay for the Google API client or the OpenAI SDK.
+_LAZY_IMPORTS = {
+    "AppConfig": ".config",
+    "get_settings": ".config",
+    "ConsolePrinter": ".console_printer",
+    "DataAnalyzer": ".data_analyzer",
+    "CSVReader": ".google_sheets_client",
+    "GoogleSheetsClient": ".google_sheets_client",
+    "GoogleSheetsError": ".google_sheets_client",
+    "LLMProcessor": ".llm_processor",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -4,20 +4,43 @@ Handles environment variables, validation, and Google credentials.
 """
 
 import base64
-import json
-from functools import lru_cache
+from functools import cache, cached_property
+from typing import TYPE_CHECKING, Literal
 
-from google.oauth2.service_account import Credentials
 from pydantic import (
     Field,
+    PrivateAttr,
     SecretStr,
     field_validator,
+    model_validator,
 )
 from pydantic_settings import (
     BaseSettings,
     SettingsConfigDict,
 )
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from google.oauth2.service_account import Credentials
+
+# Values in .env.example start with this marker (e.g. "your_api_key")
+_PLACEHOLDER_PREFIX = "your"
+
+_SCOPES = ("https://www.googleapis.com/auth/spreadsheets.readonly",)
+
+_REQUIRED_CRED_FIELDS = frozenset(
+    {
+        "type",
+        "project_id",
+        "private_key",
+        "client_email",
+    }
+)
+
 
 class AppConfig(BaseSettings):
     """
@@ -68,18 +91,101 @@ class AppConfig(BaseSettings):
         validation_alias="OPENROUTER_MODEL",
     )
 
+    llm_max_async: int = Field(
+        10,
+        validation_alias="LLM_MAX_ASYNC",
+        description="Maximum number of concurrent LLM requests",
+        ge=1,
+    )
+
+    llm_rpm: int = Field(
+        60,
+        validation_alias="LLM_RPM",
+        description="LLM requests per minute allowed by the provider",
+        ge=1,
+    )
+
+    llm_tpm: int = Field(
+        150_000,
+        validation_alias="LLM_TPM",
+        description="LLM tokens per minute allowed by the provider",
+        ge=1,
+    )
+
+    llm_max_retries: int = Field(
+        5,
+        validation_alias="LLM_MAX_RETRIES",
+        description="Retries of an LLM request after a transient error",
+        ge=0,
+    )
+
+    llm_retry_base: float = Field(
+        1.0,
+        validation_alias="LLM_RETRY_BASE",
+        description="Base delay in seconds of the exponential backoff",
+        gt=0,
+    )
+
+    llm_context_tokens: int = Field(
+        32_768,
+        validation_alias="LLM_CONTEXT_TOKENS",
+        description="Context window of the model, prompt and reply tokens",
+        ge=1024,
+    )
+    llm_max_response_tokens: int = Field(
+        4096,
+        validation_alias="LLM_MAX_RESPONSE_TOKENS",
+        description="Maximum reply tokens of a single LLM call",
+        ge=500,
+    )
+
+    llm_batch_mode: Literal["off", "inline", "async"] = Field(
+        "off",
+        validation_alias="LLM_BATCH_MODE",
+        description=(
+            "off - one LLM call per request, "
+            "inline - several requests per LLM call, "
+            "async - provider Batch API"
+        ),
+    )
+
+    llm_batch_size: int = Field(
+        20,
+        validation_alias="LLM_BATCH_SIZE",
+        description="Requests per LLM call in inline batch mode",
+        ge=1,
+    )
+
+    llm_cache_path: str = Field(
+        ".cache/llm_cache.sqlite3",
+        validation_alias="LLM_CACHE_PATH",
+        description="SQLite file with cached LLM responses",
+    )
+
+    llm_cache_ttl: int = Field(
+        0,
+        validation_alias="LLM_CACHE_TTL",
+        description="Seconds a cached LLM response stays valid, 0 - forever",
+        ge=0,
+    )
+
     # --- APP SETTINGS ---
     debug: bool = Field(
         False,
         validation_alias="DEBUG",
     )
 
+    # --- DECODED CREDENTIALS ---
+    _credentials_info: dict = PrivateAttr(default_factory=dict)
+
     # --- PYDANTIC ---
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
         case_sensitive=False,
+        frozen=True,
+        hide_input_in_errors=True,
     )
 
     # --- VALIDATORS ---
@@ -89,7 +195,7 @@ class AppConfig(BaseSettings):
         cls,
         v: str,
     ) -> str:
-        if "your" in v:
+        if v.startswith(_PLACEHOLDER_PREFIX):
             raise ValueError("SPREADSHEET_ID not set in .env file")
         return v.strip()
 
@@ -100,61 +206,67 @@ class AppConfig(BaseSettings):
         v: SecretStr,
     ) -> SecretStr:
         val = v.get_secret_value()
-        if not val or "your" in val:
+        if not val or val.startswith(_PLACEHOLDER_PREFIX):
             raise ValueError("GOOGLE_CREDENTIALS_BASE64 not set")
+        return v
 
-        # Validate Base64 and JSON
+    @model_validator(mode="after")
+    def decode_creds(self) -> "AppConfig":
+        """
+        Validates Base64 and JSON of the credentials.
+        The decoded JSON is kept for later use, so the key
+        is decoded only once per process.
+        """
+        # Corrupted input is caught by the JSON parser below,
+        # so strict alphabet validation of the base64 string is skipped.
         try:
             decoded = base64.b64decode(
-                val,
-                validate=True,
+                self.google_credentials_base64.get_secret_value(),
             )
-            data = json.loads(decoded)
+            data = json_loads(decoded)
 
-            required = [
-                "type",
-                "project_id",
-                "private_key",
-                "client_email",
-            ]
-            if any(f not in data for f in required):
+            missing = _REQUIRED_CRED_FIELDS - data.keys()
+            if missing:
                 raise ValueError(
-                    f"JSON key missing required fields: {required}",
+                    f"JSON key missing required fields: {sorted(missing)}",
                 )
 
         except Exception as e:
             raise ValueError(f"Error decoding Base64 key: {e}") from e
 
-        return v
+        self._credentials_info = data
+        return self
 
     # --- UTILITY METHODS ---
-    @property
+    @cached_property
     def is_llm_enabled(self) -> bool:
         """Is AI enabled?"""
         key = self.openrouter_api_key.get_secret_value()
-        return bool(key and "your" not in key)
+        return bool(key and not key.startswith(_PLACEHOLDER_PREFIX))
+
+    @property
+    def credentials_info(self) -> dict:
+        """Decoded service account JSON."""
+        return self._credentials_info
+
+    @cached_property
+    def google_credentials(self) -> "Credentials":
+        """
+        Ready Google authentication object.
+        Built on first access only, so runs that never touch
+        Google Sheets skip the private key parsing.
+        """
+        from google.oauth2.service_account import Credentials
 
-    def get_google_credentials(self) -> Credentials:
-        """Returns ready Google authentication object."""
-        json_data = json.loads(
-            base64.b64decode(
-                self.google_credentials_base64.get_secret_value(),
-            ),
-        )
         return Credentials.from_service_account_info(
-            json_data,
-            scopes=["https://www.googleapis.com/auth/spreadsheets.readonly"],
+            self.credentials_info,
+            scopes=_SCOPES,
         )
 
     def get_service_email(self) -> str:
         """Get service account email for logs."""
         try:
-            creds = json.loads(
-                base64.b64decode(
-                    self.google_credentials_base64.get_secret_value(),
-                ),
-            )
-            return creds.get(
+            return self.credentials_info.get(
                 "client_email",
                 "unknown",
             )
@@ -162,7 +274,7 @@ class AppConfig(BaseSettings):
             return "error"
 
 
-@lru_cache
+@cache
 def get_settings() -> AppConfig:
     """
     Creates configuration once and caches it (Singleton).
@@ -183,4 +295,8 @@ def get_settings() -> AppConfig:
         raise
 
 
-config = get_settings()
+def __getattr__(name: str) -> AppConfig:
+    """Loads `config` on first access instead of at import (PEP 562)."""
+    if name == "config":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
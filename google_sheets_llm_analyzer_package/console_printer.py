@@ -3,15 +3,35 @@
 Module for console output formatting and display.
 """
 
-from typing import Any, ClassVar
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from rich.box import ROUNDED
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
 from rich.table import Table
 
-from google_sheets_llm_analyzer_package.config import AppConfig
-from google_sheets_llm_analyzer_package.data_analyzer import AnalysisResult
+if TYPE_CHECKING:
+    from google_sheets_llm_analyzer_package.config import AppConfig
+    from google_sheets_llm_analyzer_package.data_analyzer import (
+        AnalysisResult,
+        LLMRequestRow,
+    )
+
+# Emoji and style of unknown priority
+_DEFAULT_PRIORITY_STYLE = (
+    "⚪",
+    "bold white",
+)
+
+# Prefix of info messages
+_INFO_PREFIX = "ℹ️  "  # noqa: RUF001
+
+# Column name and style of the per-request details table
+_DETAILS_COLUMNS = (
+    ("Field", "dim"),
+    ("Value", "white"),
+)
 
 
 class ConsolePrinter:
@@ -55,7 +75,7 @@ class ConsolePrinter:
             justify="full",
         )
 
-    def print_config_summary(self, config: AppConfig):
+    def print_config_summary(self, config: "AppConfig"):
         """Display configuration summary."""
         self.console.print(
             Panel.fit(
@@ -93,6 +113,14 @@ class ConsolePrinter:
             "LLM Key",
             "Provided" if config.is_llm_enabled else "Not provided",
         )
+        table.add_row(
+            "LLM Concurrency",
+            str(config.llm_max_async),
+        )
+        table.add_row(
+            "LLM Batch Mode",
+            config.llm_batch_mode,
+        )
         table.add_row(
             "Debug Mode",
             "Yes" if config.debug else "No",
@@ -105,8 +133,8 @@ class ConsolePrinter:
 
     def print_statistics(
         self,
-        result: AnalysisResult,
-        llm_results: list[dict[str, Any]] | None = None,
+        result: "AnalysisResult",
+        llm_results: "list[LLMRequestRow] | None" = None,
     ):
         """
         Display statistics in a formatted way.
@@ -131,7 +159,7 @@ class ConsolePrinter:
         if llm_results:
             self._print_llm_analysis(llm_results)
 
-    def _print_main_stats(self, result: AnalysisResult):
+    def _print_main_stats(self, result: "AnalysisResult"):
         """Print main statistics table."""
         self.console.print(
             Panel(
@@ -162,12 +190,16 @@ class ConsolePrinter:
             style="yellow",
         )
 
+        total = result.total_requests
+        format_percentage = self._format_percentage
+        add_row = table.add_row
+
         for category, count in result.categories_sorted:
-            percent = self._format_percentage(
+            percent = format_percentage(
                 count,
-                result.total_requests,
+                total,
             )
-            table.add_row(
+            add_row(
                 category,
                 str(count),
                 f"{percent}%",
@@ -178,9 +210,11 @@ class ConsolePrinter:
             end="\n\n",
         )
 
-    def _print_summary(self, result: AnalysisResult):
+    def _print_summary(self, result: "AnalysisResult"):
         """Print summary table."""
         total = result.total_requests
+        most_common_category = result.most_common_category
+        most_common_count = result.most_common_count
 
         table = Table(
             show_header=False,
@@ -198,22 +232,22 @@ class ConsolePrinter:
 
         table.add_row(
             "Total Requests",
-            str(result.total_requests),
+            str(total),
         )
         table.add_row(
             "Unique Categories",
             str(len(result.category_counts)),
         )
 
-        if result.most_common_category:
+        if most_common_category:
             percent = self._format_percentage(
-                result.most_common_count,
+                most_common_count,
                 total,
             )
             table.add_row(
                 "Most Popular Category",
-                f"[bold]{result.most_common_category}[/bold] "
-                f"({result.most_common_count} requests, "
+                f"[bold]{most_common_category}[/bold] "
+                f"({most_common_count} requests, "
                 f"{percent}%)",
             )
 
@@ -226,7 +260,7 @@ class ConsolePrinter:
             end="\n\n",
         )
 
-    def _print_llm_analysis(self, llm_results: list[dict[str, Any]]):
+    def _print_llm_analysis(self, llm_results: "list[LLMRequestRow]"):
         """Print LLM analysis results."""
         self.console.print(
             Panel(
@@ -238,85 +272,89 @@ class ConsolePrinter:
         )
 
         for request in llm_results:
-            if request.get("llm_analysis"):
-                self._print_single_request_analysis(request)
+            if request.llm_analysis:
+                self._print_single_request_analysis(
+                    request,
+                    request.llm_analysis,
+                )
 
         self.console.print(
             f"[dim]Total analyzed requests: {len(llm_results)}[/dim]",
             end="\n\n",
         )
 
-    def _print_single_request_analysis(self, request: dict[str, Any]):
+    def _print_single_request_analysis(
+        self,
+        request: "LLMRequestRow",
+        analysis: Any,
+    ):
         """Print analysis for a single request."""
-        analysis = request["llm_analysis"]
         emoji, style = self.PRIORITY_STYLES.get(
             analysis.priority,
-            (
-                "⚪",
-                "bold white",
+            _DEFAULT_PRIORITY_STYLE,
+        )
+
+        # Collect the whole block and render it with a single print;
+        # empty strings keep blank lines between parts
+        renderables: list[RenderableType] = [
+            f"{emoji} [bold]Request #{request.row_number}[/bold] "
+            f"(ID: {request.id})",
+            "",
+            self._create_details_table(
+                request,
+                analysis,
+                style,
             ),
-        )
-
-        self.console.print(
-            f"{emoji} [bold]Request #{request['row_number']}[/bold] "
-            f"(ID: {request['id']})",
-            end="\n\n",
-        )
-
-        # Print details table
-        self._print_request_details(
-            request,
-            analysis,
-            style,
-        )
+        ]
 
-        # Print summary and recommendation
         if analysis.summary:
-            self.console.print(
+            renderables += [
                 "   [dim]📝 Summary:[/dim] "
                 f"[italic]{analysis.summary}[/italic]",
-                end="\n\n",
-            )
+                "",
+            ]
 
         if analysis.recommendation:
-            self.console.print(
+            renderables += [
                 f"   [dim]💡 Recommendation:[/dim] {analysis.recommendation}",
-                end="\n\n",
-            )
+                "",
+            ]
 
-    def _print_request_details(
+        self.console.print(
+            Group(*renderables),
+            end="",
+        )
+
+    def _create_details_table(
         self,
-        request: dict[str, Any],
+        request: "LLMRequestRow",
         analysis: Any,
         style: str,
-    ):
-        """Print request details table."""
+    ) -> Table:
+        """Create request details table."""
         table = Table(
             show_header=False,
             box=None,
             padding=(0, 2),
             expand=False,
         )
-        table.add_column(
-            "Field",
-            style="dim",
-        )
-        table.add_column(
-            "Value",
-            style="white",
-        )
+        for name, column_style in _DETAILS_COLUMNS:
+            table.add_column(
+                name,
+                style=column_style,
+            )
 
         table.add_row(
             "Category",
-            request.get("category", "Not specified"),
+            request.category,
         )
         table.add_row(
             "Date",
-            request.get("date", "Not specified"),
+            request.date,
         )
         table.add_row(
             "Choice",
-            request.get("choice", "Not specified"),
+            request.choice,
         )
         table.add_row(
             "Priority",
@@ -327,12 +365,10 @@ class ConsolePrinter:
             f"{analysis.processing_time:.2f} sec",
         )
 
-        self.console.print(
-            table,
-            end="\n\n",
-        )
+        return table
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _format_percentage(
         count: int,
         total: int,
@@ -362,7 +398,18 @@ class ConsolePrinter:
 
     def print_info(self, message: str):
         """Print info message."""
-        self.console.print(f"[blue]ℹ️  {message}[/blue]")
+        self.console.print(f"[blue]{_INFO_PREFIX}{message}[/blue]")
+
+    def print_raw_data(self, data: list[list[Any]]):
+        """Print numbered raw table rows as a single block."""
+        self.console.print(
+            "\n".join(
+                f"{_INFO_PREFIX}{i}: {row}" for i, row in enumerate(data)
+            ),
+            style="blue",
+            markup=False,
+            highlight=False,
+        )
 
     def print_completion_summary(
         self,
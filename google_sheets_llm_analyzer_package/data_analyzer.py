@@ -3,9 +3,15 @@ Data analysis from Google Sheets.
 Statistics calculation, data preparation for LLM.
 """
 
+import sys
 from collections import Counter
+from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import Any
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from google_sheets_llm_analyzer_package.llm_processor import LLMAnalysis
 
 
 @dataclass
@@ -28,10 +34,24 @@ class AnalysisResult:
     def categories_sorted(self) -> list[tuple[str, int]]:
         """Categories sorted by count (descending)."""
         return sorted(
-            self.category_counts.items(), key=lambda x: x[1], reverse=True
+            self.category_counts.items(),
+            key=itemgetter(1),
+            reverse=True,
         )
 
 
+@dataclass(slots=True)
+class LLMRequestRow:
+    """Table row prepared for LLM analysis."""
+
+    row_number: int
+    id: str
+    date: str
+    category: str
+    choice: str
+    llm_analysis: "LLMAnalysis | None" = None
+
+
 class DataAnalyzer:
     """Statistical data analyzer for spreadsheet data."""
 
@@ -41,82 +61,175 @@ class DataAnalyzer:
     ):
         self.category_column = category_column
 
+        # Categories repeat heavily, so each raw value is stripped once
+        self._category_cache: dict[str, str] = {}
+
+    def _get_category(
+        self,
+        row: list[Any],
+    ) -> str:
+        """Returns stripped category of the row or empty string."""
+        if len(row) < self.category_column:
+            return ""
+
+        category = row[self.category_column - 1]
+        if isinstance(category, str):
+            cleaned = self._category_cache.get(category)
+            if cleaned is None:
+                cleaned = sys.intern(category.strip())
+                self._category_cache[category] = cleaned
+            return cleaned
+        return str(category).strip() if category else ""
+
+    @staticmethod
+    def _clean_value(value: Any) -> Any:
+        """Strips strings and replaces None with empty string."""
+        if isinstance(value, str):
+            return value.strip()
+        return "" if value is None else value
+
+    def _build_request(
+        self,
+        row_number: int,
+        row: list[Any],
+    ) -> LLMRequestRow | None:
+        """Returns request of the row or None without description."""
+        # Table structure:
+        # A: Number, B: Date, C: Category, D: Choice
+        # Add only if there's a description, checked before
+        # the other columns are cleaned
+        if len(row) < 4:
+            return None
+
+        choice = self._clean_value(row[3])
+        if not choice:
+            return None
+
+        request_id, date, category = map(self._clean_value, row[:3])
+
+        return LLMRequestRow(
+            row_number=row_number,
+            id=request_id or str(row_number),
+            date=date,
+            category=category,
+            choice=choice,
+        )
+
+    def _build_result(
+        self,
+        category_counts: Counter[str],
+        total_rows: int,
+        raw_data: list[list[Any]],
+    ) -> AnalysisResult:
+        """Builds AnalysisResult from category counts."""
+        # Empty string collects rows without category
+        skipped_rows = category_counts.pop("", 0)
+        if skipped_rows:
+            print(f"⚠️  Skipped {skipped_rows} rows without category")
+
+        if not category_counts:
+            return AnalysisResult(
+                total_requests=0,
+                total_rows=total_rows,
+                category_counts={},
+                most_common_category="",
+                most_common_count=0,
+                raw_data=raw_data,
+            )
+
+        top_categories = category_counts.most_common(1)
+        most_common_category, most_common_count = top_categories[0]
+
+        return AnalysisResult(
+            total_requests=category_counts.total(),
+            total_rows=total_rows,
+            category_counts=dict(category_counts),
+            most_common_category=most_common_category,
+            most_common_count=most_common_count,
+            raw_data=raw_data,
+        )
+
+    @staticmethod
+    def _report_requests(requests: list[LLMRequestRow]) -> None:
+        """Prints number of requests found for LLM analysis."""
+        if requests:
+            print(
+                f"✅ Found {len(requests)} requests with description for"
+                " LLM analysis"
+            )
+        else:
+            print("❌  No requests with description found for LLM analysis")
+
     def analyze(
         self,
         data: list[list[Any]],
+        include_raw: bool = False,
     ) -> AnalysisResult:
         """
         Analyzes table data.
 
         Args:
             data: List of table rows (first row - headers)
+            include_raw: Whether to keep rows in raw_data of the result
 
         Returns:
             AnalysisResult with analysis results
         """
-        if len(data) <= 1:
-            return AnalysisResult(
-                total_requests=0,
-                total_rows=len(data),
-                category_counts={},
-                most_common_category="",
-                most_common_count=0,
-                raw_data=data,
-            )
-
-        categories = []
-        skipped_rows = []
+        category_counts = Counter(self._get_category(row) for row in data[1:])
 
-        for i, row in enumerate(data[1:], start=2):
-            if len(row) >= self.category_column:
-                category = row[self.category_column - 1]
-                if isinstance(category, str):
-                    category = category.strip()
-                else:
-                    category = str(category).strip() if category else ""
-
-                if category:
-                    categories.append(category)
-                else:
-                    skipped_rows.append(i)
-            else:
-                skipped_rows.append(i)
+        return self._build_result(
+            category_counts,
+            total_rows=len(data),
+            raw_data=data if include_raw else [],
+        )
 
-        if len(skipped_rows):
-            print(f"⚠️  Skipped {len(skipped_rows)} rows without category")
+    def analyze_stream(
+        self,
+        rows: Iterable[list[Any]],
+        collect_requests: bool = True,
+    ) -> tuple[AnalysisResult, list[LLMRequestRow]]:
+        """
+        Analyzes table rows and prepares LLM requests in a single pass.
+        Rows are not kept, so raw_data of the result is empty.
 
-        if not categories:
-            return AnalysisResult(
-                total_requests=0,
-                total_rows=len(data),
-                category_counts={},
-                most_common_category="",
-                most_common_count=0,
-                raw_data=data,
-            )
+        Args:
+            rows: Table rows (first row - headers)
+            collect_requests: Whether to prepare requests for LLM
 
-        category_counts = Counter(categories)
+        Returns:
+            AnalysisResult and list of requests with description
+        """
+        category_counts: Counter[str] = Counter()
+        requests: list[LLMRequestRow] = []
+        total_rows = 0
+
+        for total_rows, row in enumerate(rows, start=1):
+            # Skip headers
+            if total_rows == 1:
+                continue
+
+            category_counts[self._get_category(row)] += 1
+
+            if collect_requests:
+                request_data = self._build_request(total_rows, row)
+                if request_data is not None:
+                    requests.append(request_data)
+
+        result = self._build_result(
+            category_counts,
+            total_rows=total_rows,
+            raw_data=[],
+        )
 
-        if category_counts:
-            most_common_category, most_common_count = (
-                category_counts.most_common(1)[0]
-            )
-        else:
-            most_common_category, most_common_count = "", 0
+        if collect_requests and total_rows > 1:
+            self._report_requests(requests)
 
-        return AnalysisResult(
-            total_requests=len(categories),
-            total_rows=len(data),
-            category_counts=dict(category_counts),
-            most_common_category=most_common_category,
-            most_common_count=most_common_count,
-            raw_data=data,
-        )
+        return result, requests
 
     def get_requests_for_llm(
         self,
         data: list[list[Any]],
-    ) -> list[dict[str, Any]]:
+    ) -> list[LLMRequestRow]:
         """
         Prepares data for LLM analysis.
 
@@ -124,42 +237,17 @@ class DataAnalyzer:
             data: Raw table data
 
         Returns:
-            List of dictionaries with request data
+            List of requests with description
         """
-        requests: list = []
-
         if len(data) <= 1:
-            return requests
+            return []
 
-        # Table structure:
-        # A: Number, B: Date, C: Category, D: Choice
-        for i, row in enumerate(data[1:], start=2):
-            request_data = {
-                "row_number": i,
-                "id": row[0] if len(row) > 0 and row[0] else str(i),
-                "date": row[1] if len(row) > 1 else "",
-                "category": row[2] if len(row) > 2 else "",
-                "choice": row[3] if len(row) > 3 else "",
-            }
-
-            # Clean string values
-            for key in request_data:
-                str_clean = request_data[key]
-                if isinstance(str_clean, str):
-                    request_data[key] = str_clean.strip()
-                elif request_data[key] is None:
-                    request_data[key] = ""
-
-            # Add only if there's a description
-            if request_data["choice"]:
-                requests.append(request_data)
+        requests = [
+            request_data
+            for i, row in enumerate(data[1:], start=2)
+            if (request_data := self._build_request(i, row)) is not None
+        ]
 
-        if requests:
-            print(
-                f"✅ Found {len(requests)} requests with description for"
-                " LLM analysis"
-            )
-        else:
-            print("❌  No requests with description found for LLM analysis")
+        self._report_requests(requests)
 
         return requests
@@ -2,13 +2,30 @@
 Client for working with Google Sheets API.
 """
 
-import json
-from typing import Any
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
-from google_sheets_llm_analyzer_package.config import config
+from google_sheets_llm_analyzer_package.config import get_settings
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from google.oauth2.service_account import Credentials
+
+# Columns read for LLM requests: A: Number, B: Date, C: Category, D: Choice
+_REQUEST_COLUMNS = 4
+
+# Spreadsheet metadata used by the client, the rest is not requested
+_METADATA_FIELDS = (
+    "properties.title,sheets(properties(title,sheetId,gridProperties))"
+)
 
 
 class GoogleSheetsError(Exception):
@@ -20,7 +37,16 @@ class GoogleSheetsError(Exception):
 class GoogleSheetsClient:
     """Client for working with Google Sheets API."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        credentials: "Credentials | None" = None,
+    ):
+        """
+        Args:
+            credentials: Pre-built Google credentials.
+                Taken from configuration if not provided.
+        """
+        config = get_settings()
         if config is None:
             raise GoogleSheetsError(
                 "Configuration not loaded. Check .env file."
@@ -28,21 +54,37 @@ class GoogleSheetsClient:
 
         self.config = config
         self._service = None
+        self._spreadsheets = None
+        self._metadata: dict[str, Any] | None = None
 
+        if credentials is not None:
+            self.credentials = credentials
+
+    @cached_property
+    def credentials(self) -> "Credentials":
+        """Google credentials, built from configuration on first use."""
         try:
-            self.credentials = config.get_google_credentials()
+            return self.config.google_credentials
         except Exception as e:
             raise GoogleSheetsError(f"Error loading credentials: {e}") from e
 
     def _get_service(self):
         """Creates and returns Google Sheets service."""
         if self._service is None:
+            credentials = self.credentials
+
             try:
+                from googleapiclient.discovery import build
+
+                # Discovery document bundled with the library is used,
+                # so no HTTP request is made to fetch it.
+                # Built per client: its HTTP transport is not thread-safe
                 self._service = build(
                     "sheets",
                     "v4",
-                    credentials=self.credentials,
+                    credentials=credentials,
                     cache_discovery=False,
+                    static_discovery=True,
                 )
             except Exception as e:
                 raise GoogleSheetsError(
@@ -51,6 +93,118 @@ class GoogleSheetsClient:
 
         return self._service
 
+    def _get_spreadsheets(self):
+        """Returns cached spreadsheets resource of the service."""
+        if self._spreadsheets is None:
+            self._spreadsheets = self._get_service().spreadsheets()
+
+        return self._spreadsheets
+
+    def _get_metadata(self, force: bool = False) -> dict[str, Any]:
+        """
+        Returns spreadsheet metadata, fetched once and reused.
+
+        Args:
+            force: Fetch again even if metadata is cached
+        """
+        if self._metadata is None or force:
+            self.invalidate_metadata()
+            self._metadata = (
+                self._get_spreadsheets()
+                .get(
+                    spreadsheetId=self.config.spreadsheet_id,
+                    fields=_METADATA_FIELDS,
+                )
+                .execute()
+            )
+
+        return self._metadata
+
+    def invalidate_metadata(self) -> None:
+        """Drops cached metadata, call after changing the spreadsheet."""
+        self._metadata = None
+        self.__dict__.pop("sheet_names", None)
+
+    @cached_property
+    def sheet_names(self) -> list[str]:
+        """Titles of all sheets in the spreadsheet."""
+        return [
+            sheet.get("properties", {}).get("title", "Unnamed")
+            for sheet in self._get_metadata().get("sheets", [])
+        ]
+
+    def _sheet_properties(self) -> dict[str, Any] | None:
+        """Returns properties of the configured sheet or None."""
+        for sheet in self._get_metadata().get("sheets", []):
+            properties = sheet.get("properties", {})
+            if properties.get("title") == self.config.sheet_name:
+                return properties
+
+        return None
+
+    @cached_property
+    def _last_column(self) -> str:
+        """Letter of the last analyzed column."""
+        return chr(
+            ord("A") + max(self.config.category_column, _REQUEST_COLUMNS) - 1
+        )
+
+    def _range_name(
+        self,
+        first_row: int | None = None,
+        last_row: int | None = None,
+    ) -> str:
+        """Returns A1 range of the analyzed columns, optionally of rows."""
+        # Fetch only the columns that are analyzed
+        last_column = self._last_column
+        if first_row is None or last_row is None:
+            return f"{self.config.sheet_name}!A:{last_column}"
+
+        return f"{self.config.sheet_name}!A{first_row}:{last_column}{last_row}"
+
+    def _get_values(self, ranges: list[str]) -> list[list[Any]]:
+        """Returns rows of all ranges, fetched with one batchGet call."""
+        result = (
+            self._get_spreadsheets()
+            .values()
+            .batchGet(
+                spreadsheetId=self.config.spreadsheet_id,
+                ranges=ranges,
+                majorDimension="ROWS",
+                valueRenderOption="FORMATTED_VALUE",
+                dateTimeRenderOption="FORMATTED_STRING",
+                fields="valueRanges(values)",
+            )
+            .execute()
+        )
+
+        return [
+            row
+            for value_range in result.get("valueRanges", [])
+            for row in value_range.get("values", [])
+        ]
+
+    def _http_error(self, e: HttpError) -> GoogleSheetsError:
+        """Converts API error into GoogleSheetsError with a hint."""
+        # Both parsers accept UTF-8 bytes directly
+        error_details = json_loads(e.content)
+        error_msg = error_details.get("error", {}).get("message", str(e))
+
+        if e.resp.status == 404:
+            return GoogleSheetsError(
+                f"Sheet not found. Check SPREADSHEET_ID: {error_msg}"
+            )
+        elif e.resp.status == 403:
+            return GoogleSheetsError(
+                "No access to sheet. Ensure that "
+                f"'{self.config.get_service_email()}' "
+                f"has access to the sheet. Error: {error_msg}"
+            )
+        else:
+            return GoogleSheetsError(
+                f"Google Sheets API error ({e.resp.status}): {error_msg}"
+            )
+
     def fetch_data(self) -> list[list[Any]]:
         """
         Retrieves data from Google Sheet.
@@ -62,23 +216,7 @@ class GoogleSheetsClient:
             GoogleSheetsError: On connection or reading error
         """
         try:
-            service = self._get_service()
-            sheet = service.spreadsheets()
-
-            range_name = f"{self.config.sheet_name}!A:Z"
-
-            result = (
-                sheet.values()
-                .get(
-                    spreadsheetId=self.config.spreadsheet_id,
-                    range=range_name,
-                    valueRenderOption="FORMATTED_VALUE",
-                    dateTimeRenderOption="FORMATTED_STRING",
-                )
-                .execute()
-            )
-
-            values = result.get("values", [])
+            values = self._get_values([self._range_name()])
 
             if not values:
                 print("📭 Sheet is empty or contains no data.")
@@ -89,26 +227,111 @@ class GoogleSheetsClient:
             return values
 
         except HttpError as e:
-            error_details = json.loads(e.content.decode("utf-8"))
-            error_msg = error_details.get("error", {}).get("message", str(e))
+            raise self._http_error(e) from e
+        except GoogleSheetsError:
+            raise
+        except Exception as e:
+            raise GoogleSheetsError(f"Error reading data: {e}") from e
 
-            if e.resp.status == 404:
-                raise GoogleSheetsError(
-                    f"Sheet not found. Check SPREADSHEET_ID: {error_msg}"
-                ) from e
-            elif e.resp.status == 403:
-                raise GoogleSheetsError(
-                    "No access to sheet. Ensure that "
-                    f"'{config.get_service_email()}' "
-                    f"has access to the sheet. Error: {error_msg}"
-                ) from e
-            else:
-                raise GoogleSheetsError(
-                    f"Google Sheets API error ({e.resp.status}): {error_msg}"
-                ) from e
+    def fetch_data_chunked(
+        self,
+        chunk_rows: int = 10_000,
+    ) -> Iterator[list[Any]]:
+        """
+        Retrieves data from Google Sheet in chunks of rows.
+        The next chunk is downloaded while the current one is processed,
+        and the whole sheet is never held in memory.
+        Sheet size is requested before returning, so access errors
+        are reported immediately. This costs one metadata request
+        more than fetch_data(), which is cached for later calls.
+        Errors of the data requests are raised while iterating.
+
+        Args:
+            chunk_rows: Number of rows per request
+
+        Returns:
+            Iterator over table rows (first row - headers)
+
+        Raises:
+            GoogleSheetsError: On connection or reading error
+        """
+        try:
+            properties = self._sheet_properties()
+        except HttpError as e:
+            raise self._http_error(e) from e
+        except GoogleSheetsError:
+            raise
         except Exception as e:
             raise GoogleSheetsError(f"Error reading data: {e}") from e
 
+        if properties is None:
+            raise GoogleSheetsError(
+                f"Sheet '{self.config.sheet_name}' not found in spreadsheet"
+            )
+
+        row_count = properties.get("gridProperties", {}).get("rowCount", 0)
+        chunks = [
+            (first_row, min(first_row + chunk_rows - 1, row_count))
+            for first_row in range(1, row_count + 1, chunk_rows)
+        ]
+
+        return self._stream_chunks(chunks)
+
+    def _stream_chunks(
+        self,
+        chunks: list[tuple[int, int]],
+    ) -> Iterator[list[Any]]:
+        """Yields rows of the chunks, prefetching one chunk ahead."""
+        loaded = 0
+        # Empty rows at the end of a chunk are omitted by the API;
+        # they are restored only if more data follows
+        pending_empty = 0
+
+        # A single worker keeps all HTTP calls on one thread,
+        # since the underlying HTTP client is not thread-safe
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Holds at most the current and the next chunk; futures
+            # are dropped once read, as they keep their rows alive
+            futures = [
+                executor.submit(
+                    self._get_values,
+                    [self._range_name(first_row, last_row)],
+                )
+                for first_row, last_row in chunks[:1]
+            ]
+
+            for i, (first_row, last_row) in enumerate(chunks):
+                if i + 1 < len(chunks):
+                    futures.append(
+                        executor.submit(
+                            self._get_values,
+                            [self._range_name(*chunks[i + 1])],
+                        )
+                    )
+
+                try:
+                    rows = futures.pop(0).result()
+                except HttpError as e:
+                    raise self._http_error(e) from e
+                except GoogleSheetsError:
+                    raise
+                except Exception as e:
+                    raise GoogleSheetsError(f"Error reading data: {e}") from e
+
+                if rows:
+                    for _ in range(pending_empty):
+                        yield []
+                    loaded += pending_empty + len(rows)
+                    pending_empty = 0
+                    yield from rows
+
+                pending_empty += last_row - first_row + 1 - len(rows)
+
+        if not loaded:
+            print("📭 Sheet is empty or contains no data.")
+        else:
+            print(f"✅ Loaded {loaded} rows from Google Sheet")
+
     def test_connection(self) -> bool:
         """
         Tests connection to Google Sheets.
@@ -117,20 +340,11 @@ class GoogleSheetsClient:
             bool: True if connection successful
         """
         try:
-            service = self._get_service()
-            sheet = service.spreadsheets()
-
-            # Get spreadsheet metadata
-            result = sheet.get(
-                spreadsheetId=self.config.spreadsheet_id,
-            ).execute()
+            # Get spreadsheet metadata, always fresh for a connection test
+            result = self._get_metadata(force=True)
 
             title = result.get("properties", {}).get("title", "Unknown")
-            sheets = result.get("sheets", [])
-            sheet_names = [
-                sheet.get("properties", {}).get("title", "Unnamed")
-                for sheet in sheets
-            ]
+            sheet_names = self.sheet_names
 
             print(
                 "✅ Connection successful!\n"
@@ -140,13 +354,7 @@ class GoogleSheetsClient:
             )
 
             # Check if specified sheet exists
-            target_sheet_exists = any(
-                sheet.get("properties", {}).get("title")
-                == self.config.sheet_name
-                for sheet in sheets
-            )
-
-            if not target_sheet_exists:
+            if self._sheet_properties() is None:
                 print(
                     f"⚠️  Sheet '{self.config.sheet_name}' not found in"
                     " spreadsheet"
@@ -160,7 +368,7 @@ class GoogleSheetsClient:
                 print("❌ Spreadsheet not found. Check SPREADSHEET_ID")
             elif e.resp.status == 403:
                 print("❌ No access to spreadsheet")
-                print(f"   Grant access to: {config.get_service_email()}")
+                print(f"   Grant access to: {self.config.get_service_email()}")
             else:
                 print(f"❌ Connection error: {e}")
             return False
@@ -172,6 +380,75 @@ class GoogleSheetsClient:
 class CSVReader:
     """Alternative data source from CSV file."""
 
+    @staticmethod
+    def _detect_encoding(filepath: str) -> str:
+        """
+        Returns 'utf-8' if the whole file decodes as UTF-8,
+        otherwise 'cp1251'. Reads the file in chunks without keeping it.
+        """
+        import codecs
+
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        try:
+            with open(filepath, "rb") as file:
+                while chunk := file.read(1 << 16):
+                    decoder.decode(chunk)
+                decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            return "cp1251"
+
+        return "utf-8"
+
+    @staticmethod
+    def iter_rows(filepath: str) -> Iterator[list[str]]:
+        """
+        Reads CSV file row by row without loading it into memory.
+        Encoding is detected before the first row is returned,
+        so a missing file is reported immediately.
+
+        Args:
+            filepath: Path to CSV file
+
+        Returns:
+            Iterator over table rows
+
+        Raises:
+            FileNotFoundError: If file not found
+        """
+        try:
+            encoding = CSVReader._detect_encoding(filepath)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"File not found: {filepath}") from e
+
+        return CSVReader._stream_rows(filepath, encoding)
+
+    @staticmethod
+    def _stream_rows(
+        filepath: str,
+        encoding: str,
+    ) -> Iterator[list[str]]:
+        """Yields CSV rows and reports their count at the end."""
+        import csv
+
+        count = 0
+        with open(
+            filepath,
+            encoding=encoding,
+            newline="",
+        ) as file:
+            for row in csv.reader(file):
+                count += 1
+                yield row
+
+        if not count:
+            print("📭 CSV file is empty.")
+        elif encoding == "utf-8":
+            print(f"✅ Loaded {count} rows from CSV file")
+        else:
+            print(
+                f"✅ Loaded {count} rows from CSV file (encoding {encoding})"
+            )
+
     @staticmethod
     def read_data(filepath: str) -> list[list[str]]:
         """
@@ -187,42 +464,14 @@ class CSVReader:
             FileNotFoundError: If file not found
             ValueError: On CSV reading error
         """
-        import csv
-
+        # Encoding is detected once, then the file is parsed in one pass
         try:
-            with open(
-                filepath,
-                encoding="utf-8",
-            ) as file:
-                reader = csv.reader(file)
-                data = list(reader)
-
-            if not data:
-                print("📭 CSV file is empty.")
-                return []
-
-            print(f"✅ Loaded {len(data)} rows from CSV file")
-            return data
-
-        except FileNotFoundError as e:
-            raise FileNotFoundError(f"File not found: {filepath}") from e
-        except UnicodeDecodeError:
-            # Try other encodings
-            try:
-                with open(
-                    filepath,
-                    encoding="cp1251",
-                ) as file:
-                    reader = csv.reader(file)
-                    data = list(reader)
-                print(
-                    f"✅ Loaded {len(data)} rows from CSV file (encoding"
-                    " cp1251)"
-                )
-                return data
-            except ValueError as e:
-                raise ValueError(
-                    f"Could not read file {filepath}. Check file encoding."
-                ) from e
+            return list(CSVReader.iter_rows(filepath))
+        except FileNotFoundError:
+            raise
+        except ValueError as e:
+            raise ValueError(
+                f"Could not read file {filepath}. Check file encoding."
+            ) from e
         except Exception as e:
             raise ValueError(f"CSV reading error: {e}") from e
@@ -0,0 +1,108 @@
+"""
+Persistent cache of LLM responses.
+Repeated runs over unchanged rows are served from disk
+instead of paying for another API call.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+
+    def _dumps_sorted(value: Any) -> bytes:
+        """Serializes value to compact JSON with sorted keys."""
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+except ImportError:
+
+    def _dumps_sorted(value: Any) -> bytes:
+        """Serializes value to compact JSON with sorted keys."""
+        # Same bytes as orjson, so keys do not depend on it being installed
+        return json.dumps(
+            value,
+            sort_keys=True,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+
+class LLMCache:
+    """LLM response cache stored in a SQLite file."""
+
+    # Request parameters that affect the response
+    KEY_FIELDS = (
+        "model",
+        "messages",
+        "temperature",
+        "max_tokens",
+    )
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = 0,
+    ):
+        """
+        Args:
+            path: SQLite file path
+            ttl: Seconds a response stays valid, 0 - forever
+        """
+        self.ttl = ttl
+
+        Path(path).parent.mkdir(
+            parents=True,
+            exist_ok=True,
+        )
+
+        # The cache may be created in a worker thread and used
+        # from the main one; access is never concurrent
+        self._connection = sqlite3.connect(
+            path,
+            check_same_thread=False,
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " created_at REAL NOT NULL"
+            ")"
+        )
+        self._connection.commit()
+
+    @classmethod
+    def make_key(cls, params: dict[str, Any]) -> str:
+        """Returns SHA-256 of the response-relevant request parameters."""
+        payload = _dumps_sorted(
+            {field: params.get(field) for field in cls.KEY_FIELDS},
+        )
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Returns cached response or None if missing or expired."""
+        min_created_at = time.time() - self.ttl if self.ttl else 0
+        row = self._connection.execute(
+            "SELECT value FROM responses WHERE key = ? AND created_at >= ?",
+            (key, min_created_at),
+        ).fetchone()
+        return row[0] if row else None
+
+    def set(
+        self,
+        key: str,
+        value: str,
+    ) -> None:
+        """Stores response."""
+        self._connection.execute(
+            "INSERT OR REPLACE INTO responses (key, value, created_at)"
+            " VALUES (?, ?, ?)",
+            (key, value, time.time()),
+        )
+        self._connection.commit()
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        self._connection.close()
@@ -3,19 +3,100 @@ LLM integration for text request analysis.
 Supports OpenRouter and OpenAI API.
 """
 
+import asyncio
 import json
+import random
 import time
+from collections.abc import AsyncIterator, Iterable
 from dataclasses import dataclass
 from typing import Any
 
 from openai import (
     APIConnectionError,
     APIError,
+    AsyncOpenAI,
+    InternalServerError,
     OpenAI,
     RateLimitError,
 )
 
-from google_sheets_llm_analyzer_package.config import config
+from google_sheets_llm_analyzer_package.config import get_settings
+from google_sheets_llm_analyzer_package.data_analyzer import LLMRequestRow
+from google_sheets_llm_analyzer_package.llm_cache import LLMCache
+from google_sheets_llm_analyzer_package.rate_limiter import AsyncRateLimiter
+
+try:
+    # HTTP clients with the SDK defaults, missing in early openai 1.x
+    from openai import DefaultAsyncHttpxClient, DefaultHttpxClient
+except ImportError:
+    # Older releases are built on httpx directly
+    from httpx import AsyncClient as DefaultAsyncHttpxClient  # type: ignore[assignment]
+    from httpx import Client as DefaultHttpxClient  # type: ignore[assignment]
+
+try:
+    # HTTP/2 support of httpx needs the optional h2 package
+    import h2  # type: ignore[import-not-found]  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import orjson
+    from orjson import loads as json_loads
+
+    def json_dumps(value: Any) -> str:
+        """Serializes value to compact JSON string."""
+        return orjson.dumps(value).decode("utf-8")
+except ImportError:
+    from json import loads as json_loads  # type: ignore[assignment]
+
+    def json_dumps(value: Any) -> str:
+        """Serializes value to compact JSON string."""
+        return json.dumps(
+            value,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+
+
+# Priority rules shared by single and batched prompts
+ANALYSIS_STEPS = """
+Analysis steps:
+1. Determine request priority (high/medium/low) based on:
+    - HIGH: critical problems (system down, data loss, security threats)
+    - MEDIUM: important issues with temporary workarounds, functionality
+      questions, errors in non-critical components
+    - LOW: informational requests, documentation questions, improvement
+      suggestions
+2. Formulate brief summary of the problem (1-2 sentences)
+3. Provide solution recommendation or next step
+"""
+
+# Terminal states of the provider Batch API
+BATCH_FINAL_STATUSES = frozenset(
+    {
+        "completed",
+        "failed",
+        "expired",
+        "cancelled",
+    }
+)
+
+# Display values of known priorities
+PRIORITY_EMOJI = {
+    "high": "🔴",
+    "medium": "🟡",
+    "low": "🟢",
+}
+PRIORITY_TEXT = {
+    "high": "HIGH",
+    "medium": "MEDIUM",
+    "low": "LOW",
+}
+
+# Canonical string objects of known priorities
+_PRIORITIES = {priority: priority for priority in PRIORITY_TEXT}
 
 
 @dataclass
@@ -28,35 +109,123 @@ class LLMAnalysis:
     raw_response: str | None
     processing_time: float
 
+    def __post_init__(self):
+        # Normalized once, so lookups need no per-access lowercasing.
+        # Known priorities share one string object, and a new lowercased
+        # copy is only made when the reply did not follow the format.
+        priority = _PRIORITIES.get(self.priority)
+        if priority is None:
+            priority = self.priority.lower()
+            priority = _PRIORITIES.get(priority, priority)
+        self.priority = priority
+
     @property
     def priority_emoji(self) -> str:
         """Returns emoji for priority."""
-        emoji_map = {
-            "high": "🔴",
-            "medium": "🟡",
-            "low": "🟢",
-        }
-        return emoji_map.get(self.priority.lower(), "⚪")
+        return PRIORITY_EMOJI.get(self.priority, "⚪")
 
     @property
     def priority_text(self) -> str:
         """Returns priority text."""
-        text_map = {
-            "high": "HIGH",
-            "medium": "MEDIUM",
-            "low": "LOW",
-        }
-        return text_map.get(self.priority.lower(), "UNKNOWN")
+        return PRIORITY_TEXT.get(self.priority, "UNKNOWN")
 
 
 class LLMProcessor:
     """Processor for working with LLM."""
 
-    def __init__(self):
+    # Transient errors worth retrying: 429, 5xx (incl. 529), connection
+    # errors and timeouts (APITimeoutError is an APIConnectionError)
+    RETRYABLE_ERRORS = (
+        RateLimitError,
+        InternalServerError,
+        APIConnectionError,
+    )
+
+    # Upper bound of a single backoff delay, seconds
+    MAX_RETRY_DELAY = 60.0
+
+    # Reply tokens reserved for one analyzed request
+    RESPONSE_TOKENS = 500
+
+    # Characters per token used by the rough token estimates
+    CHARS_PER_TOKEN = 4
+
+    # Prompts are built once at import, not per request
+    _SYSTEM_PROMPT = (
+        """
+You are an experienced technical support specialist.
+Analyze user's problem description and provide structured analysis.
+"""
+        + ANALYSIS_STEPS
+        + """
+Response format - strictly JSON:
+{
+    "priority": "high|medium|low",
+    "summary": "brief problem summary in English",
+    "recommendation": "specific solution recommendation in English"
+}
+
+Be specific in recommendations. If problem requires urgent solution, mention
+it."""
+    )
+
+    _USER_PROMPT_TEMPLATE = """
+User request:
+
+[
+Category:
+{category}
+
+Problem description:
+{choice}
+]
+
+Analyze this request according to instructions above."""
+
+    _BATCH_SYSTEM_PROMPT = (
+        """
+You are an experienced technical support specialist.
+You receive a JSON array of user requests, each with "id", "category"
+and "description". Analyze every request independently.
+"""
+        + ANALYSIS_STEPS
+        + """
+Response format - strictly JSON, one result per request:
+{
+    "results": [
+        {
+            "id": "id of the request",
+            "priority": "high|medium|low",
+            "summary": "brief problem summary in English",
+            "recommendation": "specific solution recommendation in English"
+        }
+    ]
+}
+
+Be specific in recommendations. If problem requires urgent solution, mention
+it."""
+    )
+
+    _BATCH_USER_PROMPT_TEMPLATE = (
+        "User requests:\n\n"
+        "{items}\n\n"
+        "Analyze these requests according to instructions above."
+    )
+
+    def __init__(
+        self,
+        use_cache: bool = True,
+    ):
+        """
+        Args:
+            use_cache: Serve repeated prompts from the on-disk cache
+        """
+        config = get_settings()
         if config is None:
             raise ValueError("Configuration not loaded")
 
         self.config = config
+        self.cache: LLMCache | None = None
 
         if not self.config.is_llm_enabled:
             self.client = None
@@ -65,21 +234,487 @@ class LLMProcessor:
 
         self._enabled = True
 
+        # Shared by the sync client and the per-run async clients
+        self._client_options: dict[str, Any] = {
+            "base_url": self.config.openrouter_base_url,
+            "api_key": self.config.openrouter_api_key.get_secret_value(),
+            "timeout": 30.0,
+            # Retries are handled by _create_completion(_async)
+            "max_retries": 0,
+        }
+
+        self.rate_limiter = AsyncRateLimiter(
+            requests_per_minute=self.config.llm_rpm,
+            tokens_per_minute=self.config.llm_tpm,
+        )
+
         try:
             self.client = OpenAI(
-                base_url=self.config.openrouter_base_url,
-                api_key=self.config.openrouter_api_key.get_secret_value(),
-                timeout=30.0,
-                max_retries=2,
+                **self._client_options,
+                http_client=DefaultHttpxClient(http2=HTTP2_AVAILABLE),
             )
         except Exception as e:
             print(f"⚠️  LLM client initialization error: {e}")
             self.client = None
 
+        if use_cache:
+            try:
+                self.cache = LLMCache(
+                    self.config.llm_cache_path,
+                    ttl=self.config.llm_cache_ttl,
+                )
+            except Exception as e:
+                print(f"⚠️  LLM cache disabled: {e}")
+
+    def _create_async_client(self) -> AsyncOpenAI:
+        """
+        Creates async client for the current event loop.
+        Concurrent requests share its connection pool,
+        multiplexed over HTTP/2 when h2 is installed.
+        """
+        return AsyncOpenAI(
+            **self._client_options,
+            http_client=DefaultAsyncHttpxClient(http2=HTTP2_AVAILABLE),
+        )
+
+    def close(self) -> None:
+        """Closes the HTTP connections and the response cache."""
+        if self.client is not None:
+            self.client.close()
+        if self.cache is not None:
+            self.cache.close()
+
     def is_available(self) -> bool:
         """Is LLM available for use?"""
         return self._enabled and self.client is not None
 
+    def _build_completion_params(
+        self,
+        choice: str,
+        category: str,
+    ) -> dict[str, Any]:
+        """Builds chat completion parameters for a single request."""
+        user_prompt = self._USER_PROMPT_TEMPLATE.format(
+            category=category if category else "Not specified",
+            choice=choice,
+        )
+
+        return {
+            "model": self.config.openrouter_model,
+            "messages": [
+                {"role": "system", "content": self._SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt},
+            ],
+            "temperature": 0.3,
+            "max_tokens": self.RESPONSE_TOKENS,
+            "response_format": {"type": "json_object"},
+        }
+
+    @staticmethod
+    def _batch_item(
+        item_id: int,
+        choice: str,
+        category: str,
+    ) -> dict[str, Any]:
+        """Returns one request of the batched prompt."""
+        return {
+            "id": item_id,
+            "category": category or "Not specified",
+            "description": choice,
+        }
+
+    def _build_batch_completion_params(
+        self,
+        requests: list[tuple[str, str]],
+    ) -> dict[str, Any]:
+        """
+        Builds chat completion parameters for several requests at once.
+        Items are numbered by their position in `requests`.
+
+        Args:
+            requests: Pairs of fitted description and category
+        """
+        items = [
+            self._batch_item(i, choice, category)
+            for i, (choice, category) in enumerate(requests)
+        ]
+        user_prompt = self._BATCH_USER_PROMPT_TEMPLATE.format(
+            items=json_dumps(items),
+        )
+
+        return {
+            "model": self.config.openrouter_model,
+            "messages": [
+                {"role": "system", "content": self._BATCH_SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt},
+            ],
+            "temperature": 0.3,
+            "max_tokens": min(
+                self.RESPONSE_TOKENS * len(requests),
+                self.config.llm_max_response_tokens,
+            ),
+            "response_format": {"type": "json_object"},
+        }
+
+    @staticmethod
+    def _parse_batch_response(
+        content: str | None,
+        start_time: float,
+        count: int,
+    ) -> list[LLMAnalysis | None]:
+        """
+        Converts batched LLM response into per-request results.
+        Processing time is split evenly between the requests.
+        """
+        if not content:
+            raise Exception("LLM returned empty response")
+
+        results = json_loads(content).get("results", [])
+        processing_time = (time.time() - start_time) / max(count, 1)
+
+        analyses: list[LLMAnalysis | None] = [None] * count
+        for result in results:
+            try:
+                index = int(result.get("id"))
+            except (TypeError, ValueError):
+                continue
+            if 0 <= index < count:
+                analyses[index] = LLMAnalysis(
+                    priority=result.get("priority", "medium"),
+                    summary=result.get("summary", ""),
+                    recommendation=result.get("recommendation", ""),
+                    raw_response=json_dumps(result),
+                    processing_time=processing_time,
+                )
+
+        return analyses
+
+    @staticmethod
+    def _is_analyzable(choice: str) -> bool:
+        """Is request description long enough for analysis?"""
+        return bool(choice) and len(choice.strip()) >= 5
+
+    def _fit_choice(
+        self,
+        choice: str,
+        category: str,
+    ) -> str | None:
+        """
+        Cuts the middle of a description that would not fit
+        into the model context window together with the reply.
+
+        Returns:
+            Description to send, or None if even the rest
+            of the prompt does not fit
+        """
+        budget = (
+            self.config.llm_context_tokens - self.RESPONSE_TOKENS
+        ) * self.CHARS_PER_TOKEN - (
+            len(self._SYSTEM_PROMPT)
+            + len(self._USER_PROMPT_TEMPLATE)
+            + len(category)
+        )
+        if len(choice) <= budget:
+            return choice
+
+        if budget < 5:
+            return None
+
+        head = budget // 2
+        tail = budget - head
+        return f"{choice[:head]}…{choice[-tail:]}"
+
+    def _build_request_params(
+        self,
+        choice: str,
+        category: str,
+    ) -> dict[str, Any] | None:
+        """
+        Builds single-request parameters with the description fitted
+        into the context window. Every mode derives cache keys from
+        these parameters, so they share cached results.
+
+        Returns:
+            Parameters, or None if the request cannot fit
+        """
+        fitted_choice = self._fit_choice(choice, category)
+        if fitted_choice is None:
+            print("⚠️  Request skipped: prompt exceeds model context")
+            return None
+
+        if fitted_choice != choice:
+            print("⚠️  Request description truncated to fit model context")
+
+        return self._build_completion_params(fitted_choice, category)
+
+    def _split_batches(
+        self,
+        requests: dict[int, tuple[str, str]],
+        batch_size: int,
+    ) -> list[list[int]]:
+        """
+        Groups requests into batches of at most `batch_size` whose
+        estimated prompt and replies fit into the context window
+        and whose replies fit into the response token limit.
+
+        Args:
+            requests: Fitted description and category by request index
+            batch_size: Maximum number of requests per batch
+
+        Returns:
+            Request indexes of every batch
+        """
+        base_tokens = (
+            len(self._BATCH_SYSTEM_PROMPT)
+            + len(self._BATCH_USER_PROMPT_TEMPLATE)
+        ) // self.CHARS_PER_TOKEN
+
+        chunks: list[list[int]] = []
+        chunk: list[int] = []
+        chunk_tokens = base_tokens
+        for i, (choice, category) in requests.items():
+            tokens = (
+                len(json_dumps(self._batch_item(i, choice, category)))
+                // self.CHARS_PER_TOKEN
+                + self.RESPONSE_TOKENS
+            )
+            if chunk and (
+                len(chunk) >= batch_size
+                or chunk_tokens + tokens > self.config.llm_context_tokens
+                or (len(chunk) + 1) * self.RESPONSE_TOKENS
+                > self.config.llm_max_response_tokens
+            ):
+                chunks.append(chunk)
+                chunk = []
+                chunk_tokens = base_tokens
+
+            chunk.append(i)
+            chunk_tokens += tokens
+
+        if chunk:
+            chunks.append(chunk)
+
+        return chunks
+
+    @staticmethod
+    def _collect_results(
+        requests: list[LLMRequestRow],
+        analyses: list[Any],
+    ) -> list[LLMRequestRow]:
+        """
+        Attaches analyses to requests and returns analyzed ones.
+        Anything that is not LLMAnalysis is treated as a failure.
+        """
+        analyzed_requests = []
+        for request, analysis in zip(requests, analyses, strict=True):
+            if isinstance(analysis, LLMAnalysis):
+                request.llm_analysis = analysis
+                analyzed_requests.append(request)
+            else:
+                request.llm_analysis = None
+
+        print(
+            f"✅ Analyzed {len(analyzed_requests)} out of {len(requests)}"
+            " requests"
+        )
+
+        return analyzed_requests
+
+    @staticmethod
+    def _estimate_tokens(params: dict[str, Any]) -> int:
+        """Rough token estimate: ~4 characters per token plus reply."""
+        prompt_chars = sum(
+            len(message["content"]) for message in params["messages"]
+        )
+        return (
+            prompt_chars // LLMProcessor.CHARS_PER_TOKEN + params["max_tokens"]
+        )
+
+    def _record_usage(
+        self,
+        estimated_tokens: int,
+        response: Any,
+    ) -> None:
+        """Replaces token estimate with usage reported by the API."""
+        usage = getattr(response, "usage", None)
+        if usage is not None and usage.total_tokens:
+            self.rate_limiter.record(estimated_tokens, usage.total_tokens)
+
+    def _retry_delay(
+        self,
+        error: Exception,
+        attempt: int,
+    ) -> float:
+        """
+        Returns seconds to wait before the next attempt.
+        Retry-After header of the response is preferred,
+        otherwise exponential backoff with jitter is used.
+        """
+        response = getattr(error, "response", None)
+        retry_after = (
+            response.headers.get("retry-after")
+            if response is not None
+            else None
+        )
+        if retry_after:
+            try:
+                return min(float(retry_after), self.MAX_RETRY_DELAY)
+            except ValueError:
+                # HTTP-date form is not worth parsing here
+                pass
+
+        return min(
+            self.config.llm_retry_base * 2**attempt + random.uniform(0, 1),
+            self.MAX_RETRY_DELAY,
+        )
+
+    def _create_completion(
+        self,
+        params: dict[str, Any],
+    ) -> Any:
+        """
+        Sends a chat completion request with the sync client
+        once the rate limiter allows it.
+        Retries transient errors with backoff.
+        """
+        if self.client is None:
+            raise Exception("LLM client not initialized")
+
+        estimated_tokens = self._estimate_tokens(params)
+        attempt = 0
+
+        while True:
+            self.rate_limiter.acquire_sync(estimated_tokens)
+            try:
+                response = self.client.chat.completions.create(**params)
+                self._record_usage(estimated_tokens, response)
+                return response
+            except self.RETRYABLE_ERRORS as e:
+                if attempt >= self.config.llm_max_retries:
+                    raise
+                time.sleep(self._retry_delay(e, attempt))
+                attempt += 1
+
+    async def _create_completion_async(
+        self,
+        client: AsyncOpenAI,
+        params: dict[str, Any],
+    ) -> Any:
+        """
+        Sends a chat completion request once the rate limiter allows it.
+        Retries transient errors with backoff.
+        """
+        estimated_tokens = self._estimate_tokens(params)
+        attempt = 0
+
+        while True:
+            await self.rate_limiter.acquire(estimated_tokens)
+            try:
+                response = await client.chat.completions.create(**params)
+                self._record_usage(estimated_tokens, response)
+                return response
+            except self.RETRYABLE_ERRORS as e:
+                if attempt >= self.config.llm_max_retries:
+                    raise
+                await asyncio.sleep(self._retry_delay(e, attempt))
+                attempt += 1
+
+    def _get_cached(
+        self,
+        params: dict[str, Any],
+    ) -> str | None:
+        """Returns cached response content for request parameters."""
+        if self.cache is None:
+            return None
+        return self.cache.get(self.cache.make_key(params))
+
+    def _store_cached(
+        self,
+        params: dict[str, Any],
+        content: str | None,
+    ) -> None:
+        """Stores response content for request parameters."""
+        if self.cache is None or not content:
+            return
+        self.cache.set(self.cache.make_key(params), content)
+
+    def _get_cached_analysis(
+        self,
+        params: dict[str, Any],
+    ) -> LLMAnalysis | None:
+        """
+        Returns cached analysis of a request for batched modes.
+        Looked up by the single-request parameters
+        (see _build_request_params), so results are shared
+        with the per-request mode and between batch sizes.
+        """
+        content = self._get_cached(params)
+        if content is None:
+            return None
+
+        try:
+            return self._parse_response(content, time.time())
+        except Exception:
+            return None
+
+    def _store_cached_analysis(
+        self,
+        params: dict[str, Any],
+        analysis: LLMAnalysis,
+    ) -> None:
+        """Stores analysis of a batched request under its single prompt."""
+        if self.cache is None:
+            return
+
+        self._store_cached(
+            params,
+            json_dumps(
+                {
+                    "priority": analysis.priority,
+                    "summary": analysis.summary,
+                    "recommendation": analysis.recommendation,
+                },
+            ),
+        )
+
+    @staticmethod
+    def _parse_response(
+        content: str | None,
+        start_time: float,
+    ) -> LLMAnalysis:
+        """Converts raw LLM response into LLMAnalysis."""
+        if not content:
+            raise Exception("LLM returned empty response")
+
+        result = json_loads(content)
+
+        return LLMAnalysis(
+            priority=result.get("priority", "medium"),
+            summary=result.get("summary", ""),
+            recommendation=result.get("recommendation", ""),
+            raw_response=content,
+            processing_time=time.time() - start_time,
+        )
+
+    def _report_error(
+        self,
+        error: Exception,
+        content: str | None,
+    ) -> None:
+        """Prints LLM analysis error."""
+        if isinstance(error, json.JSONDecodeError):
+            print(f"❌ LLM returned invalid JSON: {error}")
+            if self.config.debug:
+                print(f"   LLM response: {content}")
+        elif isinstance(error, RateLimitError):
+            print("⚠️  LLM API rate limit exceeded")
+        elif isinstance(error, APIConnectionError):
+            print("⚠️  LLM API connection error")
+        elif isinstance(error, APIError):
+            print(f"⚠️  LLM API error: {error}")
+        else:
+            print(f"⚠️  Unexpected error in LLM analysis: {error}")
+
     def analyze_request(
         self,
         choice: str,
@@ -95,114 +730,89 @@ class LLMProcessor:
         Returns:
             LLMAnalysis or None in case of error
         """
-        if not self.is_available():
+        if not self.is_available() or self.client is None:
             return None
 
-        if not choice or len(choice.strip()) < 5:
+        if not self._is_analyzable(choice):
+            return None
+
+        params = self._build_request_params(choice, category)
+        if params is None:
             return None
 
         start_time = time.time()
+        content = self._get_cached(params)
 
         try:
-            # System prompt for request analysis.
-            # Hardcoded for now, can be made dynamic in the future
-            system_prompt = """
-You are an experienced technical support specialist.
-Analyze user's problem description and provide structured analysis.
-
-Analysis steps:
-1. Determine request priority (high/medium/low) based on:
-    - HIGH: critical problems (system down, data loss, security threats)
-    - MEDIUM: important issues with temporary workarounds, functionality
-      questions, errors in non-critical components
-    - LOW: informational requests, documentation questions, improvement
-      suggestions
-2. Formulate brief summary of the problem (1-2 sentences)
-3. Provide solution recommendation or next step
-
-Response format - strictly JSON:
-{
-    "priority": "high|medium|low",
-    "summary": "brief problem summary in English",
-    "recommendation": "specific solution recommendation in English"
-}
+            if content is not None:
+                return self._parse_response(content, start_time)
 
-Be specific in recommendations. If problem requires urgent solution, mention
-it."""
+            response = self._create_completion(params)
+            content = response.choices[0].message.content
 
-            user_prompt = f"""
-User request:
+            analysis = self._parse_response(content, start_time)
+            self._store_cached(params, content)
+            print("Analyzing next request...")
+            return analysis
 
-[
-Category:
-{category if category else "Not specified"}
+        except Exception as e:
+            self._report_error(e, content)
+            return None
 
-Problem description:
-{choice}
-]
+    async def analyze_request_async(
+        self,
+        client: AsyncOpenAI,
+        choice: str,
+        category: str = "",
+    ) -> LLMAnalysis | None:
+        """
+        Analyzes request description using LLM without blocking.
 
-Analyze this request according to instructions above."""
+        Args:
+            client: Async client of the current event loop
+            choice: Request text
+            category: Request category
 
-            if self.client:
-                response = self.client.chat.completions.create(
-                    model=self.config.openrouter_model,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt},
-                    ],
-                    temperature=0.3,
-                    max_tokens=500,
-                    response_format={"type": "json_object"},
-                )
+        Returns:
+            LLMAnalysis or None in case of error
+        """
+        if not self._is_analyzable(choice):
+            return None
 
-            content = response.choices[0].message.content
+        params = self._build_request_params(choice, category)
+        if params is None:
+            return None
 
-            if not content:
-                raise Exception("LLM returned empty response")
+        start_time = time.time()
+        content = self._get_cached(params)
 
-            result = json.loads(content)
+        try:
+            if content is not None:
+                return self._parse_response(content, start_time)
 
-            processing_time = time.time() - start_time
-            print("Analyzing next request...")
+            response = await self._create_completion_async(client, params)
+            content = response.choices[0].message.content
 
-            return LLMAnalysis(
-                priority=result.get("priority", "medium").lower(),
-                summary=result.get("summary", ""),
-                recommendation=result.get("recommendation", ""),
-                raw_response=content,
-                processing_time=processing_time,
-            )
+            analysis = self._parse_response(content, start_time)
+            self._store_cached(params, content)
+            return analysis
 
-        except json.JSONDecodeError as e:
-            print(f"❌ LLM returned invalid JSON: {e}")
-            if config and config.debug:
-                print(f"   LLM response: {content}")
-            return None
-        except RateLimitError:
-            print("⚠️  LLM API rate limit exceeded")
-            return None
-        except APIConnectionError:
-            print("⚠️  LLM API connection error")
-            return None
-        except APIError as e:
-            print(f"⚠️  LLM API error: {e}")
-            return None
         except Exception as e:
-            print(f"⚠️  Unexpected error in LLM analysis: {e}")
+            self._report_error(e, content)
             return None
 
-    def analyze_multiple_requests(
+    async def analyze_multiple_requests_async(
         self,
-        requests: list[dict[str, Any]],
-    ) -> list[dict[str, Any]]:
+        requests: list[LLMRequestRow],
+    ) -> list[LLMRequestRow]:
         """
-        Analyzes multiple requests with rate limiting.
+        Analyzes multiple requests concurrently.
 
         Args:
             requests: List of requests for analysis
 
         Returns:
-            List of requests with analysis results
+            List of requests with analysis results, in input order
         """
         if not self.is_available():
             print("❌  LLM analysis disabled (no API key)")
@@ -211,35 +821,401 @@ Analyze this request according to instructions above."""
         if not requests:
             return []
 
-        analyzed_requests = []
         total_requests = len(requests)
 
+        # The prompt depends only on category and description,
+        # so rows with equal ones share a single LLM call
+        unique_requests: dict[tuple[str, str], LLMRequestRow] = {}
+        for request in requests:
+            unique_requests.setdefault(
+                (request.category, request.choice),
+                request,
+            )
+
         print(f"🤖 Starting analysis of {total_requests} requests via LLM...")
+        if len(unique_requests) < total_requests:
+            print(
+                f"   {total_requests - len(unique_requests)} duplicates"
+                " will reuse results of identical requests"
+            )
 
-        for i, request in enumerate(requests, 1):
-            print(f"   Analyzing request {i}/{total_requests}...", end="\r")
+        # Bounds in-flight requests to stay within provider rate limits
+        semaphore = asyncio.Semaphore(self.config.llm_max_async)
 
-            analysis = self.analyze_request(
-                choice=request.get("choice", ""),
-                category=request.get("category", ""),
+        async def analyze_limited(
+            client: AsyncOpenAI,
+            request: LLMRequestRow,
+        ) -> LLMAnalysis | None:
+            async with semaphore:
+                return await self.analyze_request_async(
+                    client,
+                    choice=request.choice,
+                    category=request.category,
+                )
+
+        # Async client is bound to the running event loop,
+        # so it is created per run instead of in __init__.
+        # Retries are handled by _create_completion_async.
+        async with self._create_async_client() as client:
+            unique_analyses = await asyncio.gather(
+                *(
+                    analyze_limited(client, request)
+                    for request in unique_requests.values()
+                ),
+                return_exceptions=True,
             )
 
-            if analysis:
-                request["llm_analysis"] = analysis
-                analyzed_requests.append(request)
+        analysis_by_key = dict(
+            zip(unique_requests, unique_analyses, strict=True),
+        )
+        analyses = [
+            analysis_by_key[(request.category, request.choice)]
+            for request in requests
+        ]
 
-                # Small delay between requests to avoid rate limits
-                if i < total_requests:
-                    time.sleep(0.5)
-            else:
-                request["llm_analysis"] = None
+        return self._collect_results(requests, analyses)
+
+    async def iter_analyze_async(
+        self,
+        requests: Iterable[LLMRequestRow],
+    ) -> AsyncIterator[tuple[LLMRequestRow, LLMAnalysis | None]]:
+        """
+        Analyzes requests concurrently, yielding each one as soon
+        as its analysis is ready (in completion order).
+        At most LLM_MAX_ASYNC requests are taken from `requests`
+        at a time, requests are not modified and results
+        are not accumulated, so they can be written out immediately.
+
+        Args:
+            requests: Requests for analysis, may be a lazy iterable
+
+        Yields:
+            Pairs of request and its analysis (None on failure)
+        """
+        if not self.is_available():
+            print("❌  LLM analysis disabled (no API key)")
+            return
+
+        async def analyze_one(
+            client: AsyncOpenAI,
+            request: LLMRequestRow,
+        ) -> tuple[LLMRequestRow, LLMAnalysis | None]:
+            analysis = await self.analyze_request_async(
+                client,
+                choice=request.choice,
+                category=request.category,
+            )
+            return request, analysis
+
+        async with self._create_async_client() as client:
+            pending: set[
+                asyncio.Task[tuple[LLMRequestRow, LLMAnalysis | None]]
+            ] = set()
+            try:
+                for request in requests:
+                    if len(pending) >= self.config.llm_max_async:
+                        done, pending = await asyncio.wait(
+                            pending,
+                            return_when=asyncio.FIRST_COMPLETED,
+                        )
+                        for task in done:
+                            yield task.result()
+
+                    pending.add(
+                        asyncio.create_task(analyze_one(client, request)),
+                    )
+
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    for task in done:
+                        yield task.result()
+            finally:
+                # The caller may stop iterating early; cancelled tasks
+                # must finish before the client is closed
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _analyze_chunk_async(
+        self,
+        client: AsyncOpenAI,
+        requests: list[tuple[str, str]],
+    ) -> list[LLMAnalysis | None] | None:
+        """
+        Analyzes several requests with a single LLM call.
+
+        Args:
+            client: Async client of the current event loop
+            requests: Pairs of fitted description and category
+
+        Returns:
+            Analyses in request order, None for requests the reply
+            could not be matched to; None on API error
+        """
+        start_time = time.time()
+
+        try:
+            response = await self._create_completion_async(
+                client,
+                self._build_batch_completion_params(requests),
+            )
+        except Exception as e:
+            self._report_error(e, None)
+            return None
+
+        content = response.choices[0].message.content
+        try:
+            return self._parse_batch_response(
+                content,
+                start_time,
+                len(requests),
+            )
+        except Exception as e:
+            self._report_error(e, content)
+            return [None] * len(requests)
+
+    async def analyze_batched_async(
+        self,
+        requests: list[LLMRequestRow],
+        batch_size: int = 20,
+    ) -> list[LLMRequestRow]:
+        """
+        Analyzes requests in groups, one LLM call per group.
+        Turns N calls into ceil(N / batch_size).
+
+        Args:
+            requests: List of requests for analysis
+            batch_size: Number of requests per LLM call
+
+        Returns:
+            List of requests with analysis results, in input order
+        """
+        if not self.is_available():
+            print("❌  LLM analysis disabled (no API key)")
+            return []
+
+        if not requests:
+            return []
+
+        # Cached requests are not sent again
+        analyses: list[LLMAnalysis | None] = [None] * len(requests)
+        params_by_index: dict[int, dict[str, Any]] = {}
+        fitted: dict[int, tuple[str, str]] = {}
+        for i, request in enumerate(requests):
+            if not self._is_analyzable(request.choice):
+                continue
+            params = self._build_request_params(
+                request.choice,
+                request.category,
+            )
+            if params is None:
+                continue
+            analyses[i] = self._get_cached_analysis(params)
+            if analyses[i] is None:
+                params_by_index[i] = params
+                fitted[i] = (
+                    self._fit_choice(request.choice, request.category)
+                    or request.choice,
+                    request.category,
+                )
+
+        chunks = self._split_batches(fitted, batch_size)
 
         print(
-            f"✅ Analyzed {len(analyzed_requests)} out of {total_requests}"
-            " requests"
+            f"🤖 Starting analysis of {len(requests)} requests via LLM"
+            f" in {len(chunks)} batches..."
         )
 
-        return analyzed_requests
+        semaphore = asyncio.Semaphore(self.config.llm_max_async)
+
+        async def analyze_single(
+            client: AsyncOpenAI,
+            request: LLMRequestRow,
+        ) -> LLMAnalysis | None:
+            async with semaphore:
+                return await self.analyze_request_async(
+                    client,
+                    choice=request.choice,
+                    category=request.category,
+                )
+
+        async def analyze_limited(
+            client: AsyncOpenAI,
+            chunk: list[int],
+        ) -> list[LLMAnalysis | None]:
+            async with semaphore:
+                analyses = await self._analyze_chunk_async(
+                    client,
+                    [fitted[i] for i in chunk],
+                )
+
+            # API errors are not retried request by request,
+            # that would only multiply failing calls
+            if analyses is None:
+                return [None] * len(chunk)
+
+            for j, analysis in enumerate(analyses):
+                if analysis is not None:
+                    self._store_cached_analysis(
+                        params_by_index[chunk[j]],
+                        analysis,
+                    )
+
+            # Requests the batched reply could not be matched to
+            # are analyzed one by one, each taking its own slot
+            missing = [
+                j for j, analysis in enumerate(analyses) if analysis is None
+            ]
+            if missing and len(chunk) > 1:
+                print(
+                    f"⚠️  {len(missing)} requests missing in batched reply,"
+                    " analyzing them one by one"
+                )
+                fallback = await asyncio.gather(
+                    *(
+                        analyze_single(client, requests[chunk[j]])
+                        for j in missing
+                    ),
+                )
+                for j, analysis in zip(missing, fallback, strict=True):
+                    analyses[j] = analysis
+
+            return analyses
+
+        async with self._create_async_client() as client:
+            chunk_results = await asyncio.gather(
+                *(analyze_limited(client, chunk) for chunk in chunks),
+            )
+
+        for chunk, results in zip(chunks, chunk_results, strict=True):
+            for i, analysis in zip(chunk, results, strict=True):
+                analyses[i] = analysis
+
+        return self._collect_results(requests, analyses)
+
+    def analyze_with_batch_api(
+        self,
+        requests: list[LLMRequestRow],
+        poll_interval: float = 30.0,
+    ) -> list[LLMRequestRow]:
+        """
+        Analyzes requests through the provider Batch API.
+        Requests are uploaded as one file and processed asynchronously
+        by the provider, which is cheaper but may take a long time.
+        Only available on OpenAI-compatible endpoints with /batches.
+
+        Args:
+            requests: List of requests for analysis
+            poll_interval: Seconds between batch status checks
+
+        Returns:
+            List of requests with analysis results, in input order
+        """
+        if not self.is_available() or self.client is None:
+            print("❌  LLM analysis disabled (no API key)")
+            return []
+
+        if not requests:
+            return []
+
+        # Cached requests are not submitted again
+        analyses: list[LLMAnalysis | None] = [None] * len(requests)
+        params_by_index: dict[int, dict[str, Any]] = {}
+        start_time = time.time()
+        for i, request in enumerate(requests):
+            if not self._is_analyzable(request.choice):
+                continue
+            params = self._build_request_params(
+                request.choice,
+                request.category,
+            )
+            if params is None:
+                continue
+            content = self._get_cached(params)
+            if content is not None:
+                try:
+                    analyses[i] = self._parse_response(content, start_time)
+                    continue
+                except Exception:
+                    pass
+            params_by_index[i] = params
+
+        if not params_by_index:
+            return self._collect_results(requests, analyses)
+
+        lines = [
+            json_dumps(
+                {
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": params,
+                },
+            )
+            for i, params in params_by_index.items()
+        ]
+
+        try:
+            batch_file = self.client.files.create(
+                file=("requests.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch",
+            )
+            batch = self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+            print(
+                f"📤 Submitted {len(lines)} requests as batch {batch.id},"
+                " waiting for results..."
+            )
+
+            while batch.status not in BATCH_FINAL_STATUSES:
+                time.sleep(poll_interval)
+                batch = self.client.batches.retrieve(batch.id)
+
+            if batch.status != "completed" or not batch.output_file_id:
+                raise Exception(
+                    f"Batch {batch.id} finished with status '{batch.status}'"
+                )
+
+            output = self.client.files.content(batch.output_file_id).text
+        except Exception as e:
+            self._report_error(e, None)
+            return self._collect_results(requests, analyses)
+
+        for line in output.splitlines():
+            content = None
+            try:
+                item = json_loads(line)
+                body = item["response"]["body"]
+                content = body["choices"][0]["message"]["content"]
+                index = int(item["custom_id"])
+                analyses[index] = self._parse_response(content, start_time)
+                self._store_cached(params_by_index[index], content)
+            except Exception as e:
+                self._report_error(e, content)
+
+        return self._collect_results(requests, analyses)
+
+    def analyze_multiple_requests(
+        self,
+        requests: list[LLMRequestRow],
+    ) -> list[LLMRequestRow]:
+        """
+        Analyzes multiple requests concurrently.
+        Synchronous wrapper over analyze_multiple_requests_async.
+
+        Args:
+            requests: List of requests for analysis
+
+        Returns:
+            List of requests with analysis results
+        """
+        return asyncio.run(self.analyze_multiple_requests_async(requests))
 
     def test_connection(self) -> bool:
         """Tests connection to LLM API."""
@@ -252,8 +1228,10 @@ Analyze this request according to instructions above."""
             return False
 
         try:
-            # Simple request to test connection
-            response = self.client.chat.completions.create(
+            # Simple request to test connection. It bypasses
+            # _create_completion, so the SDK retries it instead
+            client = self.client.with_options(max_retries=2)
+            response = client.chat.completions.create(
                 model=self.config.openrouter_model,
                 messages=[
                     {
@@ -0,0 +1,107 @@
+"""
+Client-side rate limiting for LLM API calls.
+Paces requests before they are sent instead of reacting to 429 responses.
+"""
+
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+    """Token bucket limiter for requests and tokens per minute."""
+
+    def __init__(
+        self,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+    ):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+
+        # Buckets start full, allowing an initial burst
+        self._available_requests = float(requests_per_minute)
+        self._available_tokens = float(tokens_per_minute)
+        self._last_refill = time.monotonic()
+
+    def _refill(self) -> None:
+        """Adds capacity accumulated since the last refill."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+
+        self._available_requests = min(
+            float(self.requests_per_minute),
+            self._available_requests + elapsed * self.requests_per_minute / 60,
+        )
+        self._available_tokens = min(
+            float(self.tokens_per_minute),
+            self._available_tokens + elapsed * self.tokens_per_minute / 60,
+        )
+
+    def _try_take(self, tokens: int) -> float:
+        """
+        Takes one request and `tokens` tokens if the window allows it.
+
+        Returns:
+            0 if capacity was taken, otherwise seconds to wait
+        """
+        self._refill()
+
+        if self._available_requests >= 1 and (
+            self._available_tokens >= tokens
+        ):
+            self._available_requests -= 1
+            self._available_tokens -= tokens
+            return 0.0
+
+        return max(
+            (1 - self._available_requests) * 60 / self.requests_per_minute,
+            (tokens - self._available_tokens) * 60 / self.tokens_per_minute,
+        )
+
+    async def acquire(self, tokens: int) -> None:
+        """
+        Waits until one request and `tokens` tokens are available.
+
+        Args:
+            tokens: Estimated token count of the request
+        """
+        # A request larger than the bucket would otherwise wait forever
+        tokens = min(tokens, self.tokens_per_minute)
+
+        # Check and take capacity without awaiting in between,
+        # so concurrent coroutines cannot both take the same slot
+        while (wait_time := self._try_take(tokens)) > 0:
+            await asyncio.sleep(wait_time)
+
+    def acquire_sync(self, tokens: int) -> None:
+        """
+        Blocking variant of acquire() for the sync client.
+
+        Args:
+            tokens: Estimated token count of the request
+        """
+        tokens = min(tokens, self.tokens_per_minute)
+
+        while (wait_time := self._try_take(tokens)) > 0:
+            time.sleep(wait_time)
+
+    def record(
+        self,
+        estimated_tokens: int,
+        actual_tokens: int,
+    ) -> None:
+        """
+        Corrects the token bucket with usage reported by the API.
+
+        Args:
+            estimated_tokens: Tokens taken by acquire()
+            actual_tokens: Total tokens of the response usage
+        """
+        self._refill()
+
+        estimated_tokens = min(estimated_tokens, self.tokens_per_minute)
+        self._available_tokens = min(
+            float(self.tokens_per_minute),
+            self._available_tokens + estimated_tokens - actual_tokens,
+        )
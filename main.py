@@ -4,27 +4,30 @@ Integrates Google Sheets, data analysis, and LLM.
 """
 
 import argparse
+import os
 import sys
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from pathlib import Path
-
-from rich.progress import (
-    Progress,
-    SpinnerColumn,
-    TextColumn,
-)
+from typing import TYPE_CHECKING, Any
 
 from google_sheets_llm_analyzer_package import (
-    AppConfig,
-    config,
     ConsolePrinter,
     DataAnalyzer,
-    CSVReader,
-    GoogleSheetsClient,
-    GoogleSheetsError,
-    LLMProcessor,
+    get_settings,
 )
 
+if TYPE_CHECKING:
+    from rich.progress import (
+        Progress,
+        TaskID,
+    )
+
+    from google_sheets_llm_analyzer_package import (
+        AppConfig,
+        LLMProcessor,
+    )
+
 EPILOG = "\n".join(
     [
         "Usage examples:",
@@ -38,7 +41,7 @@ EPILOG = "\n".join(
 
 
 def validate_config(
-    current_config: AppConfig,
+    current_config: "AppConfig",
     printer: ConsolePrinter,
 ) -> None:
     """If config is None -> sys.exit(1)."""
@@ -51,46 +54,83 @@ def validate_config(
 
 
 @contextmanager
-def show_progress(
-    description: str,
-    printer: ConsolePrinter,
-):
-    """Show progress"""
+def show_progress(printer: ConsolePrinter):
+    """
+    Show one progress display shared by all pipeline stages.
+    Yields None when output is not a terminal,
+    since the spinner would not be visible anyway.
+    """
+    if not printer.console.is_terminal:
+        yield None
+        return
+
+    from rich.progress import (
+        Progress,
+        SpinnerColumn,
+        TextColumn,
+    )
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=printer.console,
         transient=True,
     ) as progress:
-        task = progress.add_task(
-            description,
-            total=None,
-            start=True,
-        )
         try:
-            progress.refresh()
-            yield progress, task
-            progress.update(
-                task,
-                completed=100,
-                description=f"✅ {description}",
-            )
+            yield progress
         except Exception:
-            progress.update(
-                task,
-                description=f"❌ {description} failed",
-            )
+            for task in progress.tasks:
+                if not task.finished:
+                    progress.update(
+                        task.id,
+                        description=f"❌ {task.description} failed",
+                    )
             raise
 
 
-def main():
-    """Main application function."""
-    printer = ConsolePrinter()
-    validate_config(config, printer)
+def start_progress_task(
+    progress: "Progress | None",
+    description: str,
+) -> "TaskID | None":
+    """Add a stage to the progress display."""
+    if progress is None:
+        return None
+
+    task = progress.add_task(
+        description,
+        total=None,
+        start=True,
+    )
+    progress.refresh()
+    return task
+
+
+def finish_progress_task(
+    progress: "Progress | None",
+    task: "TaskID | None",
+    description: str,
+) -> None:
+    """Mark a progress stage as completed."""
+    if progress is None or task is None:
+        return
+
+    progress.update(
+        task,
+        total=100,
+        completed=100,
+        description=description,
+    )
 
-    printer.print_banner()
-    printer.print_config_summary(config)
 
+def create_llm_processor(use_cache: bool) -> "LLMProcessor":
+    """Import openai and create LLM processor (slow, run in background)."""
+    from google_sheets_llm_analyzer_package import LLMProcessor
+
+    return LLMProcessor(use_cache=use_cache)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build command line arguments parser."""
     parser = argparse.ArgumentParser(
         description="Google Sheets data analysis with LLM integration",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -119,6 +159,11 @@ def main():
         action="store_true",
         help="Connection test only",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not use cached LLM responses",
+    )
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -130,13 +175,32 @@ def main():
         help="Show raw data (only with --debug)",
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+# Built once at import, reused by every main() call
+PARSER = build_parser()
+
+
+def main():
+    """Main application function."""
+    args = PARSER.parse_args()
+
+    printer = ConsolePrinter()
+    config = get_settings()
+    validate_config(config, printer)
+
+    if not args.test:
+        printer.print_banner()
+        printer.print_config_summary(config)
 
     # API connections test only mode
     if args.test:
         printer.print_info("Connection test...")
 
         if args.api:
+            from google_sheets_llm_analyzer_package import GoogleSheetsClient
+
             printer.print_info("Testing Google Sheets...")
             try:
                 client = GoogleSheetsClient()
@@ -149,9 +213,11 @@ def main():
                 printer.print_error(f"Google Sheets: {e}")
 
         if args.llm:
+            from google_sheets_llm_analyzer_package import LLMProcessor
+
             printer.print_info("Testing LLM...")
             try:
-                llm_processor = LLMProcessor()
+                llm_processor = LLMProcessor(use_cache=False)
                 if llm_processor.test_connection():
                     printer.print_success("LLM: OK")
 
@@ -162,68 +228,118 @@ def main():
         return
 
     # Main mode
+    use_llm = args.llm and config.is_llm_enabled
     try:
-        with show_progress(
-            "Loading data...",
-            printer,
-        ) as (
-            progress,
-            task,
+        with (
+            ThreadPoolExecutor(max_workers=1) as executor,
+            show_progress(printer) as progress,
         ):
+            # Prepare LLM client while data is loading
+            llm_future = (
+                executor.submit(create_llm_processor, not args.no_cache)
+                if use_llm
+                else None
+            )
+
+            task = start_progress_task(progress, "Loading data...")
+
+            from google_sheets_llm_analyzer_package import GoogleSheetsError
+
+            data: Iterable[list[Any]]
             if args.api:
-                # Use table via API
+                from google_sheets_llm_analyzer_package import (
+                    GoogleSheetsClient,
+                )
+
+                # Use table via API, rows are streamed in chunks
                 try:
+                    # Credentials are resolved and validated by the client
                     client = GoogleSheetsClient()
-                    data = client.fetch_data()
+                    data = client.fetch_data_chunked()
                 except GoogleSheetsError as e:
                     printer.print_error(f"Google Sheets error: {e}")
                     if args.debug:
                         printer.print_error("", show_exception=True)
                     sys.exit(1)
             else:
+                from google_sheets_llm_analyzer_package import CSVReader
+
                 # Use CSV file
-                if not Path(args.csv).exists():
+                if not os.path.isfile(args.csv):
                     printer.print_error(f"File not found: {args.csv}")
                     sys.exit(1)
 
+                # Rows are streamed into the analyzer, not kept in memory
                 try:
-                    data = CSVReader.read_data(args.csv)
+                    data = CSVReader.iter_rows(args.csv)
                 except Exception as e:
                     printer.print_error(f"CSV reading error: {e}")
                     sys.exit(1)
 
-            progress.update(
-                task,
-                completed=100,
-                description="✅ Data loaded",
-            )
-
-        if args.raw and args.debug and data:
-            printer.print_info("Raw Data")
-            for i, row in enumerate(data):
-                printer.print_info(f"{i}: {row}")
-
-        # Analyze data statistics
-        analyzer = DataAnalyzer(category_column=config.category_column)
-        result = analyzer.analyze(data)
-
-        # LLM Analysis
-        llm_results = None
-        if args.llm and config.is_llm_enabled:
-            with show_progress(
-                "Running LLM analysis...",
-                printer,
-            ) as (progress, task):
+            # Rows are loaded while they are consumed, so errors
+            # of the later chunks surface here
+            try:
+                if args.raw and args.debug:
+                    # Raw listing needs all rows at once
+                    data = list(data)
+                    if data:
+                        printer.print_info("Raw Data")
+                        printer.print_raw_data(data)
+
+                # Analyze data statistics and prepare LLM requests
+                # in one pass
+                analyzer = DataAnalyzer(
+                    category_column=config.category_column,
+                )
+                result, requests_for_llm = analyzer.analyze_stream(
+                    data,
+                    collect_requests=use_llm,
+                )
+            except GoogleSheetsError as e:
+                printer.print_error(f"Google Sheets error: {e}")
+                if args.debug:
+                    printer.print_error("", show_exception=True)
+                sys.exit(1)
+            # Rows are not needed during LLM analysis
+            del data
+
+            finish_progress_task(progress, task, "✅ Data loaded")
+
+            # LLM Analysis
+            llm_results = None
+            if llm_future is not None:
+                import asyncio
+
+                task = start_progress_task(
+                    progress,
+                    "Running LLM analysis...",
+                )
                 try:
-                    llm_processor = LLMProcessor()
-                    requests_for_llm = analyzer.get_requests_for_llm(data)
-                    llm_results = llm_processor.analyze_multiple_requests(
-                        requests_for_llm,
-                    )
-                    progress.update(
+                    llm_processor = llm_future.result()
+                    try:
+                        if config.llm_batch_mode == "inline":
+                            llm_results = asyncio.run(
+                                llm_processor.analyze_batched_async(
+                                    requests_for_llm,
+                                    batch_size=config.llm_batch_size,
+                                ),
+                            )
+                        elif config.llm_batch_mode == "async":
+                            llm_results = llm_processor.analyze_with_batch_api(
+                                requests_for_llm,
+                            )
+                        else:
+                            llm_results = asyncio.run(
+                                llm_processor.analyze_multiple_requests_async(
+                                    requests_for_llm,
+                                ),
+                            )
+                    finally:
+                        llm_processor.close()
+                    finish_progress_task(
+                        progress,
                         task,
-                        completed=100,
-                        description="✅ LLM analysis complete",
+                        "✅ LLM analysis complete",
                     )
                 except Exception as e:
                     printer.print_warning(f"LLM analysis error: {e}")
@@ -239,7 +355,7 @@ def main():
         printer.print_completion_summary(
             success=True,
             total_requests=result.total_requests,
-            llm_enabled=args.llm and config.is_llm_enabled,
+            llm_enabled=use_llm,
             llm_analyzed=len(llm_results) if llm_results else 0,
         )
 
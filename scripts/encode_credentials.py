@@ -7,6 +7,48 @@ import base64
 import json
 import sys
 from pathlib import Path
+from typing import Any
+
+try:
+    from orjson import dumps as orjson_dumps
+    from orjson import loads as json_loads
+
+    def json_dumps(value: Any) -> str:
+        """Serializes value to minified JSON string."""
+        return orjson_dumps(value).decode("utf-8")
+except ImportError:
+    from json import loads as json_loads  # type: ignore[assignment]
+
+    def json_dumps(value: Any) -> str:  # type: ignore[misc]
+        """Serializes value to minified JSON string."""
+        return json.dumps(
+            value,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+
+
+try:
+    # SIMD-accelerated implementation, used when installed
+    from pybase64 import b64decode, b64encode_as_string
+except ImportError:
+    from base64 import b64decode  # type: ignore[assignment]
+
+    def b64encode_as_string(s: bytes) -> str:  # type: ignore[misc]
+        """Encodes bytes to base64 string."""
+        return base64.b64encode(s).decode("ascii")
+
+
+REQUIRED_FIELDS = frozenset(
+    {
+        "type",
+        "project_id",
+        "private_key_id",
+        "private_key",
+        "client_email",
+        "client_id",
+    }
+)
 
 
 def print_usage():
@@ -30,20 +72,10 @@ def print_usage():
 
 def validate_json(data: dict) -> bool:
     """Validates that JSON is a valid service account."""
-    required_fields = [
-        "type",
-        "project_id",
-        "private_key_id",
-        "private_key",
-        "client_email",
-        "client_id",
-    ]
-
-    # Check required fields
-    for field in required_fields:
-        if field not in data:
-            print(f"❌ Missing required field: {field}")
-            return False
+    missing = REQUIRED_FIELDS.difference(data)
+    if missing:
+        print(f"❌ Missing required fields: {', '.join(sorted(missing))}")
+        return False
 
     # Check type
     if data.get("type") != "service_account":
@@ -82,7 +114,7 @@ def main():
             json_path,
             encoding="utf-8",
         ) as f:
-            json_data = json.load(f)
+            json_data = json_loads(f.read())
 
         # Validate JSON
         if not validate_json(json_data):
@@ -90,16 +122,11 @@ def main():
             sys.exit(1)
 
         # Convert JSON to string (minified)
-        json_str = json.dumps(
-            json_data,
-            separators=(
-                ",",
-                ":",
-            ),
-        )
+        json_str = json_dumps(json_data)
 
         # Encode to base64
-        base64_str = base64.b64encode(json_str.encode("utf-8")).decode("ascii")
+        json_bytes = json_str.encode("utf-8")
+        base64_str = b64encode_as_string(json_bytes)
 
         # Display result
         project_id = json_data.get(
@@ -143,10 +170,12 @@ def main():
         # Decoding test
         print("\n🧪 Testing decoding...")
         try:
-            decoded = base64.b64decode(base64_str).decode("utf-8")
-            decoded_json = json.loads(decoded)
-            if decoded_json:
+            # Byte comparison with the encoded JSON, no need to reparse it
+            decoded = b64decode(base64_str, validate=True)
+            if decoded == json_bytes:
                 print("✅ Base64 successfully decodes to valid JSON")
+            else:
+                print("❌ Decoded data does not match the original JSON")
         except Exception as e:
             print(f"❌ Error during test: {e}")
 